@@ -1,13 +1,46 @@
 import os
 import sys
+import io
+import struct
+import zlib
 from pathlib import Path
+import PIL
 from PIL import Image
 import subprocess
 import tempfile
 import shutil
 import logging
-from typing import Optional, List, Union, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
+import functools
+import atexit
+import threading
+from typing import Optional, List, Union, Tuple, Dict, ClassVar
+from concurrent.futures import (Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor,
+                                BrokenExecutor, as_completed)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo acelera algunas operaciones
+    np = None
+
+try:
+    from tqdm import tqdm
+except ImportError:  # tqdm es opcional: barra de progreso en batch_convert
+    tqdm = None
+
+try:
+    import fpnge
+except ImportError:  # fpnge es opcional: codificador PNG SIMD para niveles rápidos
+    fpnge = None
+
+try:
+    import oxipng
+except ImportError:  # pyoxipng es opcional: optimiza los PNG finales (optimize_png)
+    oxipng = None
+
+# Pillow-SIMD (reemplazo directo de Pillow) publica versiones como '9.5.0.post1'
+# y acelera el remuestreo LANCZOS con SSE4/AVX2
+PILLOW_SIMD = '.post' in PIL.__version__
 
 class IconConverter:
     """Clase para convertir imágenes a formatos de ícono (ICNS de macOS y ICO de Windows)"""
@@ -18,36 +51,137 @@ class IconConverter:
     # Tamaños recomendados para ICO de Windows
     ICO_SIZES = [16, 24, 32, 48, 64, 128, 256]
     
+    # Tamaños ICO hasta este valor se guardan con paleta de 256 colores (PNG indexado)
+    ICO_PALETTE_MAX_SIZE = 48
+    
+    # Tipos (OSType) del contenedor ICNS con datos PNG y su tamaño en píxeles
+    ICNS_TYPES = [
+        (b'icp6', 64),
+        (b'ic07', 128), (b'ic08', 256), (b'ic09', 512), (b'ic10', 1024),
+        (b'ic11', 32), (b'ic12', 64), (b'ic13', 256), (b'ic14', 512),
+    ]
+    
+    # Tipos ICNS sin PNG para tamaños pequeños: RGB con RLE + máscara alpha de 8 bits
+    ICNS_RAW_TYPES = [(b'is32', b's8mk', 16), (b'il32', b'l8mk', 32)]
+    
+    # Niveles zlib por defecto: los PNG que el escritor integrado guarda en el ICNS
+    # son la salida final (priorizar tamaño); los del iconset de iconutil son
+    # intermedios (priorizar velocidad)
+    ICNS_PNG_COMPRESS_LEVEL = 9
+    ICONSET_PNG_COMPRESS_LEVEL = 1
+    
+    # Máximo de hilos para codificar PNG dentro de una misma conversión
+    MAX_ENCODE_WORKERS = 8
+    
+    # Con use_numba, el núcleo solo se usa con fuentes grandes y varios núcleos de CPU
+    FAST_RESIZE_MIN_PIXELS = 1024 * 1024
+    FAST_RESIZE_MIN_CPUS = 4
+    
+    # Niveles de la pirámide hasta este tamaño usan small_filter en lugar de LANCZOS
+    SMALL_FILTER_MAX_SIZE = 64
+    
+    # En reducciones grandes, Pillow reduce primero con filtro de caja hasta
+    # quedar a este factor del destino y solo entonces aplica el filtro final
+    REDUCING_GAP = 3.0
+    
+    # Cota superior del tamaño de un ícono generado (un ICNS rara vez supera 2 MB)
+    MAX_OUTPUT_SIZE = 2_000_000
+    
     SUPPORTED_FORMATS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif', '.gif', '.webp'}
     
+    # Pool de workers compartido entre llamadas a batch_convert
+    _pool: ClassVar[Optional[Executor]] = None
+    _pool_key: ClassVar[Optional[Tuple[type, int]]] = None
+    _pool_lock: ClassVar[threading.Lock] = threading.Lock()
+    _pool_atexit: ClassVar[bool] = False
+    
     def __init__(self, preserve_alpha: bool = True, quality: int = 95, 
-                 auto_upscale: bool = False, verbose: bool = True):
+                 auto_upscale: bool = False, verbose: bool = True,
+                 use_iconutil: bool = False, force: bool = False,
+                 png_compress_level: Optional[int] = None,
+                 small_filter: Image.Resampling = Image.Resampling.BICUBIC,
+                 optimize_png: bool = False,
+                 use_numba: bool = False):
         """
         Args:
             preserve_alpha: Si True, preserva transparencia (requiere PNG)
             quality: Calidad de compresión (1-100)
             auto_upscale: Si True, escala automáticamente imágenes pequeñas
             verbose: Si True, muestra mensajes de progreso
+            use_iconutil: Si True, genera ICNS con iconutil (solo macOS)
+                en lugar del escritor integrado
+            force: Si True, regenera íconos aunque ya estén actualizados
+            png_compress_level: Nivel zlib (0-9) de los PNG del ICNS. Por defecto,
+                9 para los PNG que el escritor integrado guarda en el ICNS y 1 (mucho
+                más rápido) para los PNG intermedios del iconset de iconutil
+            small_filter: Filtro de remuestreo para los tamaños pequeños (≤ 64 px)
+                de la pirámide; BICUBIC es más barato que LANCZOS y a esos tamaños
+                la diferencia no se aprecia
+            optimize_png: Si True, optimiza cada PNG final con oxipng (sin pérdida,
+                más lento pero bastante más pequeño); requiere pyoxipng
+            use_numba: Si True, usa el núcleo LANCZOS de Numba (fast_resize) para
+                fuentes grandes. Desactivado por defecto: en general Pillow es más
+                rápido y, con el pool de procesos, los hilos de Numba compiten por
+                los mismos núcleos; conviene medirlo en cada equipo
         """
+        if png_compress_level is not None and not 0 <= png_compress_level <= 9:
+            raise ValueError("png_compress_level debe estar entre 0 y 9")
+        
+        if optimize_png and oxipng is None:
+            raise ImportError("optimize_png requiere pyoxipng (pip install pyoxipng)")
+        
         self.preserve_alpha = preserve_alpha
         self.quality = quality
         self.auto_upscale = auto_upscale
+        self.use_iconutil = use_iconutil
+        self.force = force
+        self.png_compress_level = png_compress_level
+        self.small_filter = small_filter
+        self.optimize_png = optimize_png
+        self.verbose = verbose
+        self._setup_logging()
+        
+        # Numba (~150 ms de import) solo se carga si se pidió; si falla, se usa Pillow
+        self.use_numba = use_numba and self._fast_resize() is not None
+        
+        if PILLOW_SIMD:
+            self.logger.debug(f"Usando Pillow-SIMD {PIL.__version__}")
+    
+    def _setup_logging(self) -> None:
+        """Crea el logger y, si verbose, configura la salida de mensajes de progreso"""
         self.logger = logging.getLogger(__name__)
         
-        if verbose:
+        if self.verbose:
             logging.basicConfig(
                 level=logging.INFO,
                 format='%(message)s'
             )
     
+    def __getstate__(self) -> dict:
+        """Estado para enviar el conversor a los procesos del pool (sin el logger)"""
+        state = self.__dict__.copy()
+        del state['logger']
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        """Reconstruye el conversor en el proceso worker, con su propio logging"""
+        self.__dict__.update(state)
+        self._setup_logging()
+    
     @staticmethod
-    def _verify_iconutil():
-        """Verifica que iconutil esté disponible (solo macOS)"""
+    @functools.lru_cache(maxsize=None)
+    def _iconutil_path() -> str:
+        """
+        Verifica que iconutil esté disponible (solo macOS) y devuelve su ruta absoluta.
+        Se busca en el PATH una sola vez por proceso.
+        """
         if sys.platform != 'darwin':
             raise OSError("La conversión a ICNS solo funciona en macOS.")
         
-        if shutil.which('iconutil') is None:
+        path = shutil.which('iconutil')
+        if path is None:
             raise OSError("'iconutil' no está disponible. Asegúrate de estar en macOS.")
+        return path
     
     def _upscale_if_needed(self, img: Image.Image, min_size: int) -> Image.Image:
         """Escala la imagen si es menor al tamaño mínimo"""
@@ -61,97 +195,465 @@ class IconConverter:
             return img.resize(new_size, Image.Resampling.LANCZOS)
         return img
     
-    def _prepare_image(self, img: Image.Image) -> Image.Image:
+    @staticmethod
+    def _prepare_image(img: Image.Image, preserve_alpha: bool) -> Image.Image:
         """Prepara la imagen para conversión (garantiza RGBA para transparencia)"""
         
-        # Guardar metadatos
-        metadata = img.info.copy() if hasattr(img, 'info') else {}
-        
-        # Convertir imágenes con paleta o modo simple
-        if img.mode == 'P':
-            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
-        
-        # Convertir a RGBA para manejar la transparencia
-        if self.preserve_alpha and img.mode != 'RGBA':
-            prepared = img.convert('RGBA')
-        # Si no se preserva alpha o la imagen no tiene, convertir a RGB
-        elif not self.preserve_alpha and img.mode == 'RGBA':
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[-1])
-            prepared = background.convert('RGB')
-        else:
+        # Guardar el perfil de color (lo único de img.info que se escribe en los PNG)
+        icc_profile = img.info.get('icc_profile')
+        
+        # Una sola conversión directa al modo final (cada convert copia la imagen completa)
+        if preserve_alpha:
+            # Conservar transparencia: RGBA
+            prepared = img if img.mode == 'RGBA' else img.convert('RGBA')
+        elif img.mode == 'RGB':
             prepared = img
+        elif img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info):
+            # Con transparencia y sin preservar alpha: mezclar sobre fondo blanco
+            if img.mode != 'RGBA':
+                img = img.convert('RGBA')
+            if np is not None:
+                # Mezcla vectorizada sobre fondo blanco en enteros de 16 bits:
+                # (rgb * a + 255 * (255 - a)) / 255, redondeado (máximo 255², cabe en uint16)
+                arr = np.asarray(img, dtype=np.uint8)
+                alpha = arr[..., 3:4].astype(np.uint16)
+                blended = arr[..., :3] * alpha + 255 * (255 - alpha) + 127
+                prepared = Image.fromarray((blended // 255).astype(np.uint8))
+            else:
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel('A'))
+                prepared = background
+        else:
+            # Sin transparencia (P, L, CMYK...): directo a RGB
+            prepared = img.convert('RGB')
         
-        # Restaurar metadatos importantes
-        if metadata:
-            prepared.info = metadata
+        # Restaurar el perfil de color: Image.fromarray no lo conserva
+        if icc_profile:
+            prepared.info['icc_profile'] = icc_profile
         
         return prepared
     
+    @staticmethod
+    def _decode_prepared(path: str, preserve_alpha: bool,
+                         min_size: int) -> Tuple[str, Tuple[int, int], bytes, Optional[bytes]]:
+        """
+        Abre, decodifica y prepara una imagen
+        
+        Returns:
+            Modo, dimensiones, píxeles en bytes (para reconstruir con Image.frombuffer)
+            y perfil ICC de la fuente (o None)
+        """
+        with Image.open(path) as img:
+            # En JPEG, dejar que libjpeg reduzca la escala (1/2, 1/4, 1/8) durante
+            # la decodificación sin bajar del tamaño mínimo requerido
+            if img.format == 'JPEG':
+                img.draft('RGB', (min_size, min_size))
+            
+            # Preparar imagen (manejar transparencia/modo)
+            prepared = IconConverter._prepare_image(img, preserve_alpha)
+            return (prepared.mode, prepared.size, prepared.tobytes(),
+                    prepared.info.get('icc_profile'))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=2)
+    def _load_prepared(path: str, mtime_ns: int, file_size: int,
+                       preserve_alpha: bool, min_size: int) -> Tuple[str, Tuple[int, int], bytes, Optional[bytes]]:
+        """
+        _decode_prepared cacheado por (ruta, mtime, tamaño), para llamadas sucesivas
+        a convert con la misma fuente. Pocas entradas: cada una es la imagen
+        decodificada completa (4 MB a 1024² RGBA)
+        """
+        return IconConverter._decode_prepared(path, preserve_alpha, min_size)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _fast_resize():
+        """
+        Importa fast_resize (NumPy + Numba: núcleo LANCZOS compilado y paralelo) la
+        primera vez que se necesita en cada proceso. Devuelve None si no se puede cargar
+        """
+        try:
+            import fast_resize
+        except Exception as e:  # No solo ImportError: una instalación rota de Numba falla de otras formas
+            logging.getLogger(__name__).warning(f"No se pudo cargar Numba ({e}): se usará Pillow")
+            return None
+        return fast_resize
+    
+    def _resize(self, img: Image.Image, size: int,
+                resample: Image.Resampling = Image.Resampling.LANCZOS) -> Image.Image:
+        """Redimensiona a size x size (LANCZOS por defecto, con núcleo Numba si se pidió)"""
+        # En los workers de spawn el import ocurre aquí, una vez por proceso
+        fast_resize = self._fast_resize() if self.use_numba else None
+        if (fast_resize is not None and resample == Image.Resampling.LANCZOS and not PILLOW_SIMD
+                and img.mode in ('RGB', 'RGBA')
+                and img.width * img.height >= self.FAST_RESIZE_MIN_PIXELS
+                and (os.cpu_count() or 1) >= self.FAST_RESIZE_MIN_CPUS):
+            resized = Image.fromarray(fast_resize.lanczos3_u8(np.asarray(img), size, size))
+            resized.info.update(img.info)
+            return resized
+        return img.resize((size, size), resample, reducing_gap=self.REDUCING_GAP)
+    
+    def _build_pyramid(self, img: Image.Image, sizes) -> Dict[int, Image.Image]:
+        """Genera en cascada las versiones cuadradas de cada tamaño, de mayor a menor"""
+        # Niveles ya generados, del más grande al más pequeño
+        levels = [img]
+        pyramid = {}
+        
+        for size in sorted(set(sizes), reverse=True):
+            # Partir del nivel más pequeño que sea múltiplo exacto (reducción entera:
+            # filtro de caja en C, mucho más barato que LANCZOS) o, si no hay, del
+            # nivel más pequeño que siga siendo mayor. Así los tamaños intermedios
+            # (p. ej. 48) no rompen la cadena 64→32→16.
+            # Image.reduce ya es la reducción 2x2 fusionada en C: una versión con
+            # NumPy (uint16, suma de cuatro vistas y desplazamiento) resultó más
+            # lenta y además obliga a reconstruir cada nivel con Image.fromarray
+            candidates = [level for level in levels if min(level.size) >= size] or [img]
+            source = next(
+                (level for level in reversed(candidates)
+                 if level.width == level.height and level.width % size == 0),
+                candidates[-1]
+            )
+            
+            if source.size == (size, size):
+                current = source
+            elif source.width == source.height and source.width % size == 0:
+                current = source.reduce(source.width // size)
+            elif size <= self.SMALL_FILTER_MAX_SIZE:
+                current = self._resize(source, size, self.small_filter)
+            else:
+                current = self._resize(source, size)
+            
+            levels.append(current)
+            pyramid[size] = current
+        
+        return pyramid
+    
+    @staticmethod
+    def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+        """Construye un chunk PNG: longitud + tipo + datos + CRC"""
+        return (struct.pack('>I', len(data)) + chunk_type + data
+                + struct.pack('>I', zlib.crc32(chunk_type + data)))
+    
+    @staticmethod
+    def _png_iccp(img: Image.Image) -> bytes:
+        """Chunk iCCP con el perfil de color de la imagen (vacío si no tiene)"""
+        icc_profile = img.info.get('icc_profile')
+        if not icc_profile:
+            return b''
+        # Nombre del perfil + separador nulo + método de compresión 0 (zlib)
+        return IconConverter._png_chunk(b'iCCP', b'ICC Profile\x00\x00' + zlib.compress(icc_profile))
+    
+    @staticmethod
+    def _encode_png(img: Image.Image, compress_level: int) -> bytes:
+        """Codifica una imagen como PNG en memoria con el nivel zlib indicado"""
+        # Nivel rápido: fpnge filtra con SIMD y usa una tabla Huffman fija, sin pasar
+        # por el compresor de zlib. El nivel 0 (sin compresión) sigue yendo a Pillow
+        if (fpnge is not None and compress_level == 1
+                and img.mode in ('RGB', 'RGBA')):
+            # fpnge no escribe el perfil de color: insertarlo tras la firma y el IHDR (33 bytes)
+            png_data = fpnge.fromPIL(img)
+            return png_data[:33] + IconConverter._png_iccp(img) + png_data[33:]
+        
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG', compress_level=compress_level)
+        return buffer.getvalue()
+    
+    def _encode_final_png(self, img: Image.Image, default_level: int) -> bytes:
+        """
+        Codifica un PNG que va al ícono final y, si se pidió, lo optimiza con oxipng.
+        Usa png_compress_level si se indicó y, si no, default_level
+        """
+        # El optimizador se paga una sola vez, sobre los bytes definitivos:
+        # la codificación previa puede ser la más rápida porque oxipng recomprime
+        if self.png_compress_level is not None:
+            level = self.png_compress_level
+        elif self.optimize_png:
+            level = self.ICONSET_PNG_COMPRESS_LEVEL
+        else:
+            level = default_level
+        
+        png_data = self._encode_png(img, level)
+        if self.optimize_png:
+            png_data = oxipng.optimize_from_memory(png_data, level=2)
+        return png_data
+    
+    @classmethod
+    def _encode_workers(cls, tasks: int) -> int:
+        """Hilos para codificar: no más que núcleos, tareas ni MAX_ENCODE_WORKERS"""
+        return max(1, min(cls.MAX_ENCODE_WORKERS, os.cpu_count() or 1, tasks))
+    
     def _create_iconset(self, img: Image.Image, iconset_dir: Path) -> None:
         """Crea el conjunto de íconos .png para iconutil (solo ICNS)"""
         iconset_dir.mkdir(parents=True, exist_ok=True)
         
-        # Cachear tamaños ya procesados para reutilizar
-        size_cache = {}
-        
+        # Archivos por tamaño en píxeles: cada @2x comparte datos con el
+        # tamaño estándar del doble (p. ej. icon_16x16@2x.png == icon_32x32.png)
+        files = {}
         for size in self.ICNS_SIZES:
             # Versión estándar
-            if size not in size_cache:
-                size_cache[size] = img.resize((size, size), Image.Resampling.LANCZOS)
-            
-            resized = size_cache[size]
-            filename = iconset_dir / f"icon_{size}x{size}.png"
-            resized.save(filename, 'PNG', optimize=True)
+            files.setdefault(size, []).append(iconset_dir / f"icon_{size}x{size}.png")
             
             # Versión @2x (retina) - no existe para 1024px
             if size < 512:
-                double_size = size * 2
-                if double_size not in size_cache:
-                    size_cache[double_size] = img.resize((double_size, double_size), Image.Resampling.LANCZOS)
-                
-                resized_2x = size_cache[double_size]
-                filename_2x = iconset_dir / f"icon_{size}x{size}@2x.png"
-                resized_2x.save(filename_2x, 'PNG', optimize=True)
+                files.setdefault(size * 2, []).append(iconset_dir / f"icon_{size}x{size}@2x.png")
+        
+        pyramid = self._build_pyramid(img, files)
+        sizes = sorted(files)
+        
+        # Codificar en paralelo: Pillow libera el GIL durante la compresión PNG
+        with ThreadPoolExecutor(max_workers=self._encode_workers(len(sizes))) as executor:
+            encode = functools.partial(self._encode_final_png, default_level=self.ICONSET_PNG_COMPRESS_LEVEL)
+            for size, png_data in zip(sizes, executor.map(encode, (pyramid[s] for s in sizes))):
+                for filename in files[size]:
+                    filename.write_bytes(png_data)
 
-    def _convert_to_icns(self, prepared_img: Image.Image, output_path: Path) -> None:
-        """Usa iconutil para convertir un iconset a ICNS"""
-        self._verify_iconutil()
+    @staticmethod
+    def _icns_rle(data: bytes) -> bytes:
+        """Comprime un canal con el RLE de ICNS (variante de PackBits)"""
+        out = bytearray()
+        i, n = 0, len(data)
+        while i < n:
+            # Repetición de 3 a 130 bytes iguales: cabecera 0x80 + (longitud - 3)
+            run = 1
+            while i + run < n and run < 130 and data[i + run] == data[i]:
+                run += 1
+            if run >= 3:
+                out.append(0x80 + run - 3)
+                out.append(data[i])
+                i += run
+                continue
+            
+            # Literal de 1 a 128 bytes hasta la próxima repetición: cabecera (longitud - 1)
+            start = i
+            while i < n and i - start < 128:
+                if i + 2 < n and data[i] == data[i + 1] == data[i + 2]:
+                    break
+                i += 1
+            out.append(i - start - 1)
+            out += data[start:i]
+        return bytes(out)
+    
+    @staticmethod
+    def _icns_chunk(ostype: bytes, data: bytes) -> bytes:
+        """Entrada ICNS: OSType + longitud (incluye la cabecera de 8 bytes) + datos"""
+        return ostype + struct.pack('>I', 8 + len(data)) + data
+    
+    def _write_icns(self, prepared_img: Image.Image, output_path: Path) -> None:
+        """Escribe el contenedor ICNS directamente, sin iconutil (multiplataforma)"""
+        png_sizes = {size for _, size in self.ICNS_TYPES}
+        raw_sizes = {size for _, _, size in self.ICNS_RAW_TYPES}
+        pyramid = self._build_pyramid(prepared_img, png_sizes | raw_sizes)
+        
+        # Codificar cada tamaño PNG una sola vez (varios tipos comparten tamaño)
+        sizes = sorted(png_sizes)
+        with ThreadPoolExecutor(max_workers=self._encode_workers(len(sizes))) as executor:
+            encode = functools.partial(self._encode_final_png, default_level=self.ICNS_PNG_COMPRESS_LEVEL)
+            png_data = dict(zip(sizes, executor.map(encode, (pyramid[s] for s in sizes))))
+        
+        chunks = []
+        
+        # Tamaños pequeños sin pasar por el codificador PNG: canales RGB con RLE + alpha
+        for rgb_type, mask_type, size in self.ICNS_RAW_TYPES:
+            level = pyramid[size]
+            channels = level.split()
+            chunks.append(self._icns_chunk(
+                rgb_type, b''.join(self._icns_rle(c.tobytes()) for c in channels[:3])
+            ))
+            alpha = channels[3].tobytes() if level.mode == 'RGBA' else b'\xff' * (size * size)
+            chunks.append(self._icns_chunk(mask_type, alpha))
+        
+        chunks.extend(self._icns_chunk(ostype, png_data[size]) for ostype, size in self.ICNS_TYPES)
+        
+        # Índice 'TOC ' (como el de iconutil): OSType + longitud de cada entrada,
+        # permite a los lectores ubicar un tamaño sin recorrer todo el archivo
+        toc = self._icns_chunk(b'TOC ', b''.join(chunk[:8] for chunk in chunks))
+        
+        body = toc + b''.join(chunks)
+        output_path.write_bytes(b'icns' + struct.pack('>I', 8 + len(body)) + body)
+
+    def _run_iconutil(self, prepared_img: Image.Image, iconset_dir: Path, output_path: Path) -> None:
+        """Crea el iconset en iconset_dir y lo convierte a ICNS con iconutil"""
+        # Crear iconset
+        self._create_iconset(prepared_img, iconset_dir)
+        
+        # Ejecutar iconutil (no escribe nada útil en stdout: solo capturar stderr).
+        # Ruta absoluta + close_fds=False permiten a subprocess usar posix_spawn
+        # en lugar de fork + exec, que copia las tablas de páginas del proceso
+        result = subprocess.run(
+            [self._iconutil_path(), '-c', 'icns', str(iconset_dir), '-o', str(output_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+            text=True,
+            check=False
+        )
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Error al crear ICNS: {result.stderr}")
+
+    def _convert_to_icns(self, prepared_img: Image.Image, output_path: Path,
+                         staging_dir: Optional[Path] = None) -> None:
+        """Convierte a ICNS con el escritor integrado o, si se pidió, con iconutil"""
+        if not self.use_iconutil:
+            self._write_icns(prepared_img, output_path)
+            return
+        
+        self._iconutil_path()
+
+        # Directorio compartido por el lote: evita crear un temporal por imagen
+        if staging_dir is not None:
+            self._run_iconutil(prepared_img, staging_dir / "icon.iconset", output_path)
+            return
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            iconset_dir = temp_path / "icon.iconset"
-            
-            # Crear iconset
-            self._create_iconset(prepared_img, iconset_dir)
-            
-            # Ejecutar iconutil
-            result = subprocess.run(
-                ['iconutil', '-c', 'icns', str(iconset_dir), '-o', str(output_path)],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Error al crear ICNS: {result.stderr}")
+            self._run_iconutil(prepared_img, Path(temp_dir) / "icon.iconset", output_path)
 
+    @staticmethod
+    def _ico_frame_size(img: Image.Image, size: int) -> Tuple[int, int]:
+        """Dimensiones de la entrada ICO de tamaño size: encaja en size x size conservando la proporción"""
+        scale = size / max(img.size)
+        return max(1, round(img.width * scale)), max(1, round(img.height * scale))
+    
     def _convert_to_ico(self, prepared_img: Image.Image, output_path: Path) -> None:
         """Usa PIL para convertir a ICO (multiplataforma)"""
         
         # PIL soporta tamaños específicos para ICO
-        sizes_tuple = [(s, s) for s in self.ICO_SIZES if s <= min(prepared_img.size)]
+        sizes = [s for s in self.ICO_SIZES if s <= min(prepared_img.size)]
         
-        if not sizes_tuple:
+        if not sizes:
             raise ValueError("La imagen es demasiado pequeña para generar tamaños ICO estándar.")
-
-        prepared_img.save(
+        
+        # Generar los tamaños en cascada con la misma pirámide que el ICNS. La pirámide
+        # es cuadrada: una fuente no cuadrada se redimensiona por tamaño conservando
+        # la proporción (como el thumbnail del escritor ICO de Pillow: 600x400 → 256x171)
+        if prepared_img.width == prepared_img.height:
+            pyramid = self._build_pyramid(prepared_img, sizes)
+        else:
+            pyramid = {
+                size: prepared_img.resize(
+                    self._ico_frame_size(prepared_img, size),
+                    self.small_filter if size <= self.SMALL_FILTER_MAX_SIZE else Image.Resampling.LANCZOS,
+                    reducing_gap=self.REDUCING_GAP
+                )
+                for size in sizes
+            }
+        
+        # Cuantizar los pequeños: a 16-48 px una paleta de 256 colores no se
+        # distingue y el PNG indexado es más barato de codificar
+        frames = []
+        for size in sizes:
+            frame = pyramid[size]
+            if size <= self.ICO_PALETTE_MAX_SIZE:
+                frame = frame.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+            
+            # Cada entrada (también las cuantizadas) debe conservar la proporción de
+            # la fuente: si no, Pillow la deformaría o la volvería a generar
+            if frame.size != self._ico_frame_size(prepared_img, size):
+                raise RuntimeError(
+                    f"Entrada ICO de {size}px con tamaño {frame.size}: "
+                    f"no conserva la proporción de {prepared_img.size}"
+                )
+            frames.append(frame)
+        
+        # El escritor ICO de Pillow usa tal cual las imágenes cuyo tamaño coincide
+        # con uno de sizes (por eso se pasan las dimensiones reales de cada entrada);
+        # la principal debe ser la mayor, o descarta los tamaños que la superan
+        frames[-1].save(
             output_path, 
             format='ICO', 
-            sizes=sizes_tuple, 
+            sizes=[frame.size for frame in frames], 
+            append_images=frames[:-1],
             quality=self.quality
         )
 
+    @staticmethod
+    def _parse_formats(target_format: Union[str, List[str]]) -> List[str]:
+        """Normaliza 'icns', 'icns,ico' o ['icns', 'ico'] a una lista de formatos válidos"""
+        if isinstance(target_format, str):
+            target_format = target_format.split(',')
+        
+        formats = []
+        for fmt in target_format:
+            fmt = fmt.strip().lower()
+            if fmt not in ['icns', 'ico']:
+                raise ValueError("El formato objetivo debe ser 'icns' o 'ico'")
+            if fmt not in formats:
+                formats.append(fmt)
+        return formats
+    
+    def _validate_input(self, input_path: Path) -> None:
+        """Verifica que la imagen de entrada exista y tenga un formato soportado"""
+        if not input_path.exists():
+            raise FileNotFoundError(f"El archivo {input_path} no existe")
+        
+        # Validar formato de entrada
+        if input_path.suffix.lower() not in self.SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Formato no soportado: {input_path.suffix}. "
+                f"Formatos válidos: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+    
+    def _is_up_to_date(self, input_stat: os.stat_result, output_path: Path) -> bool:
+        """True si el ícono ya existe y es más reciente que la imagen de entrada"""
+        if self.force:
+            return False
+        try:
+            return output_path.stat().st_mtime_ns >= input_stat.st_mtime_ns
+        except FileNotFoundError:
+            return False
+    
+    def _min_size(self, target_format: str) -> int:
+        """Tamaño mínimo de la imagen de entrada para el formato"""
+        return 1024 if target_format == 'icns' else max(self.ICO_SIZES)
+    
+    def _load_image(self, input_path: Path, input_stat: os.stat_result, min_size: int,
+                    cached: bool = True) -> Image.Image:
+        """Abre y prepara la imagen (cacheado por ruta, mtime y tamaño si cached)"""
+        if cached:
+            mode, size, data, icc_profile = self._load_prepared(
+                str(input_path), input_stat.st_mtime_ns, input_stat.st_size,
+                self.preserve_alpha, min_size
+            )
+        else:
+            mode, size, data, icc_profile = self._decode_prepared(
+                str(input_path), self.preserve_alpha, min_size
+            )
+        # Los bytes son inmutables: mapearlos (solo lectura) en lugar de copiarlos.
+        # Pillow comparte memoria en modos como RGBA y copia en el resto
+        img = Image.frombuffer(mode, size, data, 'raw', mode, 0, 1)
+        if icc_profile:
+            img.info['icc_profile'] = icc_profile
+        return img
+    
+    def _fit_size(self, prepared_img: Image.Image, target_format: str) -> Image.Image:
+        """Valida o escala el tamaño de la imagen para el formato"""
+        min_size = self._min_size(target_format)
+        
+        if min(prepared_img.size) < min_size:
+            if self.auto_upscale:
+                return self._upscale_if_needed(prepared_img, min_size)
+            
+            min_required = 16 if target_format == 'ico' else min_size
+            if min(prepared_img.size) < min_required:
+                raise ValueError(
+                    f"La imagen debe tener al menos {min_required}x{min_required} píxeles "
+                    f"para {target_format.upper()}. Use --auto-upscale para escalar automáticamente."
+                )
+        return prepared_img
+    
+    def _convert_prepared(self, prepared_img: Image.Image, target_format: str,
+                          output_path: Path, staging_dir: Optional[Path] = None) -> Path:
+        """Valida el tamaño y llama al conversor específico"""
+        sized_img = self._fit_size(prepared_img, target_format)
+        
+        if target_format == 'icns':
+            self._convert_to_icns(sized_img, output_path, staging_dir)
+        elif target_format == 'ico':
+            self._convert_to_ico(sized_img, output_path)
+        
+        self.logger.info(f"✓ Creado: {output_path.name}")
+        return output_path
+    
     def convert(self, 
                 input_path: Union[str, Path], 
                 target_format: str,
@@ -173,15 +675,7 @@ class IconConverter:
         if target_format not in ['icns', 'ico']:
             raise ValueError("El formato objetivo debe ser 'icns' o 'ico'")
 
-        if not input_path.exists():
-            raise FileNotFoundError(f"El archivo {input_path} no existe")
-        
-        # Validar formato de entrada
-        if input_path.suffix.lower() not in self.SUPPORTED_FORMATS:
-            raise ValueError(
-                f"Formato no soportado: {input_path.suffix}. "
-                f"Formatos válidos: {', '.join(self.SUPPORTED_FORMATS)}"
-            )
+        self._validate_input(input_path)
         
         # Determinar ruta de salida
         suffix = f".{target_format}"
@@ -191,52 +685,178 @@ class IconConverter:
             output_path = Path(output_path).with_suffix(suffix) 
             output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Abrir, validar y copiar la imagen
-        prepared_img = None
+        # Omitir si el ícono ya existe y es más reciente que la imagen de entrada
+        stat = input_path.stat()
+        if self._is_up_to_date(stat, output_path):
+            self.logger.info(f"↷ Sin cambios: {output_path.name}")
+            return output_path
+        
+        prepared_img = self._load_image(input_path, stat, self._min_size(target_format))
         try:
-            with Image.open(input_path) as img:
-                min_size = 1024 if target_format == 'icns' else max(self.ICO_SIZES)
-                
-                # Validar o escalar tamaño
-                if min(img.size) < min_size:
-                    if self.auto_upscale:
-                        img = self._upscale_if_needed(img, min_size)
-                    else:
-                        min_required = 16 if target_format == 'ico' else min_size
-                        if min(img.size) < min_required:
-                            raise ValueError(
-                                f"La imagen debe tener al menos {min_required}x{min_required} píxeles "
-                                f"para {target_format.upper()}. Use --auto-upscale para escalar automáticamente."
-                            )
-                
-                # Preparar imagen (manejar transparencia/modo)
-                temp_prepared_img = self._prepare_image(img)
-                
-                # Copiar la imagen para que sea independiente
-                prepared_img = temp_prepared_img.copy()
-
-        except Exception:
-            raise
-
-        if prepared_img is None:
-            raise RuntimeError("Fallo al cargar la imagen.")
-
-        # Llamar al conversor específico
-        if target_format == 'icns':
-            self._convert_to_icns(prepared_img, output_path)
-        elif target_format == 'ico':
-            self._convert_to_ico(prepared_img, output_path)
+            return self._convert_prepared(prepared_img, target_format, output_path)
+        finally:
+            # Cerrar la imagen preparada
+            prepared_img.close()
+    
+    def convert_many(self,
+                     input_path: Union[str, Path],
+                     formats: Union[str, List[str]],
+                     output_dir: Optional[Union[str, Path]] = None) -> List[Path]:
+        """
+        Convierte una imagen a varios formatos decodificándola una sola vez
+        
+        Args:
+            input_path: Ruta de la imagen de entrada
+            formats: Lista de formatos ('icns', 'ico') o 'icns,ico'
+            output_dir: Carpeta de salida (opcional, por defecto la de la imagen)
         
-        # Cerrar la imagen preparada
-        prepared_img.close()
+        Returns:
+            Lista de archivos de ícono creados
+        """
+        outputs, errors = self._convert_group(
+            [Path(input_path)], self._parse_formats(formats), output_dir
+        )
         
-        self.logger.info(f"✓ Creado: {output_path.name}")
-        return output_path
+        # Los demás formatos ya se generaron: informar cada fallo y propagar el primero
+        for output_path, error in errors[1:]:
+            self.logger.error(f"✗ Error en {output_path.name}: {error}")
+        if errors:
+            raise errors[0][1]
+        return outputs
+    
+    def _convert_group(self,
+                       input_paths: List[Path],
+                       formats: List[str],
+                       output_dir: Optional[Union[str, Path]] = None,
+                       staging_dir: Optional[Path] = None,
+                       in_batch: bool = False) -> Tuple[List[Path], List[Tuple[Path, Exception]]]:
+        """
+        Convierte uno o más archivos con el mismo contenido (p. ej. enlaces al
+        mismo inodo) a varios formatos, decodificando la imagen una sola vez.
+        batch_convert pasa in_batch=True: ya creó la carpeta de salida y cada
+        grupo se decodifica una sola vez, así que no se usa la caché de imágenes.
+        batch_convert también asigna a cada grupo su staging_dir, el directorio
+        del iconset de iconutil dentro del temporal compartido por el lote.
+        
+        Un error en un formato no impide generar los demás.
+        
+        Returns:
+            Íconos creados (o ya actualizados) y lista de (salida, error) fallidos
+        """
+        for input_path in input_paths:
+            self._validate_input(input_path)
+        
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            if not in_batch:
+                output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Omitir los formatos cuyo ícono ya está actualizado
+        stat = input_paths[0].stat()
+        outputs = []
+        pending = []
+        for input_path in input_paths:
+            base_path = input_path if output_dir is None else output_dir / input_path.name
+            for target_format in formats:
+                output_path = base_path.with_suffix(f".{target_format}")
+                outputs.append(output_path)
+                if self._is_up_to_date(stat, output_path):
+                    self.logger.info(f"↷ Sin cambios: {output_path.name}")
+                else:
+                    pending.append((target_format, output_path))
+        
+        if not pending:
+            return outputs, []
+        
+        # Decodificar una vez, al tamaño que necesita el formato más exigente
+        min_size = max(self._min_size(target_format) for target_format, _ in pending)
+        prepared_img = self._load_image(input_paths[0], stat, min_size, cached=not in_batch)
+        errors = []
+        try:
+            for target_format, output_path in pending:
+                try:
+                    self._convert_prepared(prepared_img, target_format, output_path, staging_dir)
+                except Exception as e:
+                    outputs.remove(output_path)
+                    errors.append((output_path, e))
+        finally:
+            prepared_img.close()
+        
+        return outputs, errors
+    
+    @classmethod
+    def _get_pool(cls, executor_class: type, max_workers: int) -> Executor:
+        """Devuelve el pool persistente, recreándolo solo si cambia el tipo o el número de workers"""
+        with cls._pool_lock:
+            if cls._pool is None or cls._pool_key != (executor_class, max_workers):
+                # Registrar el cierre una sola vez por proceso, aunque el pool se recree
+                if not cls._pool_atexit:
+                    atexit.register(cls._shutdown_pool)
+                    cls._pool_atexit = True
+                if cls._pool is not None:
+                    # Las tareas ya enviadas al pool anterior terminan normalmente
+                    cls._pool.shutdown(wait=False)
+                cls._pool = executor_class(max_workers=max_workers)
+                cls._pool_key = (executor_class, max_workers)
+            return cls._pool
+    
+    @classmethod
+    def _shutdown_pool(cls) -> None:
+        """Cierra el pool persistente (registrado con atexit)"""
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.shutdown()
+                cls._pool = None
+                cls._pool_key = None
     
-    def _check_disk_space(self, image_files: List[Path], output_folder: Path) -> None:
+    @classmethod
+    def _discard_pool(cls, pool: Executor) -> None:
+        """Descarta un pool roto, sin esperar, solo si sigue siendo el pool compartido"""
+        with cls._pool_lock:
+            # Otra llamada a batch_convert pudo haberlo reemplazado ya: no tocar el nuevo
+            if cls._pool is pool:
+                cls._pool = None
+                cls._pool_key = None
+                pool.shutdown(wait=False)
+    
+    def _submit_groups(self,
+                       executor_class: type,
+                       max_workers: int,
+                       file_groups: List[List[Path]],
+                       formats: List[str],
+                       output_folder: Path,
+                       staging_root: Optional[str]) -> Dict[Future, List[Path]]:
+        """
+        Envía cada grupo de archivos al pool persistente. Si el pool quedó roto
+        (p. ej. un worker murió por falta de memoria), lo recrea y reintenta una vez
+        """
+        for attempt in range(2):
+            # El pool se reutiliza entre llamadas (no se cierra al terminar el lote)
+            executor = self._get_pool(executor_class, max_workers)
+            try:
+                return {
+                    executor.submit(
+                        self._convert_group,
+                        files,
+                        formats,
+                        output_folder,
+                        Path(staging_root) / str(index) if staging_root else None,
+                        True
+                    ): files
+                    for index, files in enumerate(file_groups)
+                }
+            except BrokenExecutor:
+                if attempt:
+                    raise
+                self.logger.warning("El pool de workers no está disponible: recreándolo")
+                self._discard_pool(executor)
+    
+    def _check_disk_space(self, image_files: List[Path], output_folder: Path,
+                          formats: List[str]) -> None:
         """Verifica que hay suficiente espacio en disco"""
-        total_size = sum(f.stat().st_size for f in image_files)
-        estimated_output = total_size * 1.5  # Estimación conservadora
+        # El tamaño de un ícono no depende del de la imagen de entrada: estimar por
+        # número de salidas evita un stat por archivo
+        estimated_output = len(image_files) * len(formats) * self.MAX_OUTPUT_SIZE
         
         free_space = shutil.disk_usage(output_folder).free
         if free_space < estimated_output:
@@ -245,9 +865,34 @@ class IconConverter:
                 f"~{estimated_output / 1e9:.1f}GB necesarios estimados"
             )
     
+    def _scan_images(self, folder: str, recursive: bool):
+        """Genera las rutas (str) de imágenes soportadas con os.scandir"""
+        subfolders = []
+        
+        # DirEntry expone el nombre y el tipo sin un stat adicional por archivo
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name, dot, ext = entry.name.rpartition('.')
+                if name and dot and f'.{ext.lower()}' in self.SUPPORTED_FORMATS and entry.is_file():
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
+        
+        # Recorrer subcarpetas después de cerrar el directorio actual (como os.walk,
+        # sin acumular descriptores abiertos ni fallar por carpetas sin permiso)
+        for subfolder in subfolders:
+            try:
+                yield from self._scan_images(subfolder, recursive)
+            except OSError as e:
+                self.logger.warning(f"No se pudo leer {subfolder}: {e}")
+    
+    def _find_images(self, input_folder: Path, recursive: bool) -> List[Path]:
+        """Busca imágenes soportadas (más rápido que Path.glob: solo crea Path para coincidencias)"""
+        return [Path(path) for path in self._scan_images(os.fspath(input_folder), recursive)]
+    
     def batch_convert(self, 
                       input_folder: Union[str, Path], 
-                      target_format: str,
+                      target_format: Union[str, List[str]],
                       output_folder: Optional[Union[str, Path]] = None,
                       recursive: bool = False,
                       max_workers: int = 4,
@@ -257,7 +902,7 @@ class IconConverter:
         
         Args:
             input_folder: Carpeta con imágenes
-            target_format: 'icns' o 'ico'
+            target_format: 'icns', 'ico' o varios ('icns,ico' / ['icns', 'ico'])
             output_folder: Carpeta de salida (opcional)
             recursive: Buscar en subcarpetas
             max_workers: Número de conversiones paralelas
@@ -265,12 +910,15 @@ class IconConverter:
         
         Returns:
             Lista de archivos de ícono creados
+        
+        Con más de una imagen y de un worker, la conversión corre en procesos
+        (ProcessPoolExecutor). En plataformas que los inician con spawn (macOS,
+        Windows), el script que llama a este método debe protegerse con
+        ``if __name__ == '__main__':``.
         """
         input_folder = Path(input_folder)
-        target_format = target_format.lower()
-        
-        if target_format not in ['icns', 'ico']:
-            raise ValueError("El formato objetivo debe ser 'icns' o 'ico'")
+        formats = self._parse_formats(target_format)
+        extensions = ', '.join(f'.{fmt}' for fmt in formats)
 
         if not input_folder.exists():
             raise FileNotFoundError(f"La carpeta {input_folder} no existe")
@@ -283,11 +931,7 @@ class IconConverter:
             output_folder.mkdir(parents=True, exist_ok=True)
         
         # Encontrar archivos
-        pattern = '**/*' if recursive else '*'
-        image_files = [
-            f for f in input_folder.glob(pattern)
-            if f.is_file() and f.suffix.lower() in self.SUPPORTED_FORMATS
-        ]
+        image_files = self._find_images(input_folder, recursive)
         
         if not image_files:
             self.logger.info("No se encontraron imágenes para convertir")
@@ -297,47 +941,87 @@ class IconConverter:
         if dry_run:
             self.logger.info(f"\n[Dry run] Se procesarían {len(image_files)} archivos:")
             for img in image_files:
-                output_name = img.with_suffix(f'.{target_format}').name
-                self.logger.info(f"  • {img.name} → {output_name}")
+                output_names = ', '.join(img.with_suffix(f'.{fmt}').name for fmt in formats)
+                self.logger.info(f"  • {img.name} → {output_names}")
             return []
         
+        # Con iconutil, fallar una sola vez antes del lote si no está disponible
+        if 'icns' in formats and self.use_iconutil:
+            self._iconutil_path()
+        
         # Verificar espacio en disco
         try:
-            self._check_disk_space(image_files, output_folder)
+            self._check_disk_space(image_files, output_folder, formats)
         except OSError as e:
             self.logger.warning(str(e))
         
-        self.logger.info(f"Encontradas {len(image_files)} imágenes. Convirtiendo a .{target_format}...")
+        self.logger.info(f"Encontradas {len(image_files)} imágenes. Convirtiendo a {extensions}...")
+        
+        # Agrupar archivos con el mismo contenido (enlaces al mismo inodo):
+        # cada grupo se decodifica y prepara una sola vez
+        stats = {f: f.stat() for f in image_files}
+        groups = {}
+        for img_file in image_files:
+            st = stats[img_file]
+            groups.setdefault((st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size), []).append(img_file)
+        
+        # Enviar primero las imágenes más grandes (LPT): reduce el tiempo de cola
+        # cuando quedan pocas tareas largas para un número fijo de workers
+        file_groups = sorted(groups.values(), key=lambda files: stats[files[0]].st_size, reverse=True)
         
         # Conversión en paralelo
         converted = []
         failed = []
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Crear tareas
-            future_to_file = {
-                executor.submit(
-                    self.convert,
-                    img_file,
-                    target_format,
-                    output_folder / img_file.with_suffix(f'.{target_format}').name
-                ): img_file
-                for img_file in image_files
-            }
+        # La conversión es intensiva en CPU (decodificación, LANCZOS, PNG) y el código
+        # Python intermedio retiene el GIL: los procesos escalan con los núcleos. Con
+        # una sola tarea o un solo worker no compensa arrancar procesos
+        if len(file_groups) > 1 and max_workers > 1:
+            executor_class = ProcessPoolExecutor
+        else:
+            executor_class = ThreadPoolExecutor
+        
+        # Con iconutil, un único directorio temporal para todo el lote
+        # (una subcarpeta por imagen) en lugar de uno por conversión
+        if 'icns' in formats and self.use_iconutil:
+            staging_context = tempfile.TemporaryDirectory()
+        else:
+            staging_context = contextlib.nullcontext()
+        
+        with staging_context as staging_root:
+            # Crear tareas (cada imagen se decodifica una vez para todos los formatos)
+            future_to_files = self._submit_groups(
+                executor_class, max_workers, file_groups, formats, output_folder, staging_root
+            )
             
             # Procesar resultados
-            for future in as_completed(future_to_file):
-                img_file = future_to_file[future]
+            completed = as_completed(future_to_files)
+            if tqdm is not None:
+                completed = tqdm(
+                    completed,
+                    total=len(future_to_files),
+                    unit='img',
+                    disable=not self.logger.isEnabledFor(logging.INFO)
+                )
+            
+            for future in completed:
+                names = ', '.join(f.name for f in future_to_files[future])
                 try:
-                    result_path = future.result()
-                    converted.append(result_path)
+                    outputs, errors = future.result()
                 except Exception as e:
-                    failed.append((img_file.name, str(e)))
-                    self.logger.error(f"✗ Error en {img_file.name}: {e}")
+                    # Falló la lectura de la imagen: ningún formato se generó
+                    failed.append((names, str(e)))
+                    self.logger.error(f"✗ Error en {names}: {e}")
+                    continue
+                
+                converted.extend(outputs)
+                for output_path, error in errors:
+                    failed.append((output_path.name, str(error)))
+                    self.logger.error(f"✗ Error en {output_path.name}: {error}")
         
         # Resumen
         self.logger.info(f"\n{'='*50}")
-        self.logger.info(f"Conversión a .{target_format} completada:")
+        self.logger.info(f"Conversión a {extensions} completada:")
         self.logger.info(f"  ✓ Exitosas: {len(converted)}")
         if failed:
             self.logger.info(f"  ✗ Fallidas: {len(failed)}")
@@ -359,12 +1043,18 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Ejemplos:
-  # Convertir a ICNS (requiere macOS)
+  # Convertir a ICNS (multiplataforma)
   %(prog)s icon.png
   %(prog)s icon.png -f icns -o ~/Desktop/mi_icono.icns
   
+  # Convertir a ICNS con iconutil (requiere macOS)
+  %(prog)s icon.png --iconutil
+  
   # Convertir a ICO (multiplataforma)
   %(prog)s icon.png -f ico
+  
+  # Generar ICNS e ICO decodificando la imagen una sola vez
+  %(prog)s icon.png -f icns,ico
   %(prog)s ./imagenes/ -f ico -r --workers 8
   
   # Previsualizar sin convertir
@@ -377,8 +1067,9 @@ Ejemplos:
     
     parser.add_argument('input', help='Archivo de imagen o directorio')
     parser.add_argument('-o', '--output', help='Archivo o directorio de salida (sin extensión)')
-    parser.add_argument('-f', '--format', default='icns', choices=['icns', 'ico'],
-                       help='Formato de ícono de salida: icns (macOS) o ico (Windows/Web). Default: icns')
+    parser.add_argument('-f', '--format', default='icns',
+                       help='Formato de ícono de salida: icns (macOS), ico (Windows/Web) '
+                            'o ambos separados por coma (icns,ico). Default: icns')
     parser.add_argument('-r', '--recursive', action='store_true',
                        help='Buscar imágenes en subcarpetas')
     parser.add_argument('--no-alpha', action='store_true',
@@ -389,8 +1080,21 @@ Ejemplos:
                        help='Número de conversiones paralelas (default: 4)')
     parser.add_argument('-q', '--quality', type=int, default=95,
                        help='Calidad de compresión 1-100 (solo para ICO). Default: 95')
+    parser.add_argument('--png-compress-level', type=int, default=None,
+                       help='Nivel de compresión PNG 0-9 dentro del ICNS (default: 9 con el escritor '
+                            'integrado, 1 para el iconset de --iconutil; 1 es el más rápido)')
+    parser.add_argument('--optimize-png', action='store_true',
+                       help='Optimizar los PNG del ICNS con oxipng (más pequeño, más lento; '
+                            'requiere pyoxipng)')
+    parser.add_argument('--numba', action='store_true',
+                       help='Usar el núcleo LANCZOS de Numba para fuentes grandes '
+                            '(requiere numpy y numba; medir antes: suele ser más lento que Pillow)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Previsualizar archivos a procesar sin convertirlos')
+    parser.add_argument('--iconutil', action='store_true',
+                       help='Generar ICNS con iconutil de macOS en lugar del escritor integrado')
+    parser.add_argument('--force', action='store_true',
+                       help='Regenerar íconos aunque sean más recientes que la imagen de entrada')
     parser.add_argument('--quiet', action='store_true',
                        help='No mostrar mensajes de progreso')
     
@@ -401,17 +1105,28 @@ Ejemplos:
             preserve_alpha=not args.no_alpha,
             quality=args.quality,
             auto_upscale=args.auto_upscale,
-            verbose=not args.quiet
+            verbose=not args.quiet,
+            use_iconutil=args.iconutil,
+            force=args.force,
+            png_compress_level=args.png_compress_level,
+            optimize_png=args.optimize_png,
+            use_numba=args.numba
         )
         
         input_path = Path(args.input)
         
+        formats = IconConverter._parse_formats(args.format)
+        
         if input_path.is_file():
-            converter.convert(input_path, args.format, args.output)
+            if len(formats) > 1:
+                # Con varios formatos, --output es la carpeta de salida
+                converter.convert_many(input_path, formats, args.output)
+            else:
+                converter.convert(input_path, formats[0], args.output)
         elif input_path.is_dir():
             converter.batch_convert(
                 input_path,
-                args.format,
+                formats,
                 args.output,
                 recursive=args.recursive,
                 max_workers=args.workers,
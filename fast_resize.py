@@ -0,0 +1,116 @@
+"""Redimensionado LANCZOS3 compilado con Numba (opcional, usado por convert_to_icns)"""
+import functools
+import math
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def _lanczos3(x: float) -> float:
+    """Núcleo Lanczos con a=3"""
+    if x == 0.0:
+        return 1.0
+    if -3.0 < x < 3.0:
+        px = math.pi * x
+        return 3.0 * math.sin(px) * math.sin(px / 3.0) / (px * px)
+    return 0.0
+
+
+@numba.njit(cache=True)
+def _coefficients(in_size: int, out_size: int):
+    """Calcula, una sola vez por eje, los límites y pesos normalizados de cada píxel de salida"""
+    scale = in_size / out_size
+    filterscale = max(scale, 1.0)
+    support = 3.0 * filterscale
+    ksize = int(math.ceil(support)) * 2 + 1
+
+    bounds = np.zeros((out_size, 2), np.int64)
+    weights = np.zeros((out_size, ksize), np.float32)
+    for xx in range(out_size):
+        center = (xx + 0.5) * scale
+        xmin = max(int(center - support + 0.5), 0)
+        count = min(int(center + support + 0.5), in_size) - xmin
+
+        total = 0.0
+        for k in range(count):
+            w = _lanczos3((k + xmin - center + 0.5) / filterscale)
+            weights[xx, k] = w
+            total += w
+        if total != 0.0:
+            for k in range(count):
+                weights[xx, k] /= total
+
+        bounds[xx, 0] = xmin
+        bounds[xx, 1] = count
+    return bounds, weights
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_coefficients(in_size: int, out_size: int):
+    """Tablas de _coefficients memorizadas: los íconos repiten siempre los mismos pares de tamaños"""
+    return _coefficients(in_size, out_size)
+
+
+def lanczos3_u8(src: np.ndarray, dst_h: int, dst_w: int) -> np.ndarray:
+    """
+    Redimensiona una imagen uint8 (alto x ancho x canales, RGB o RGBA) con LANCZOS3
+
+    Igual que Pillow, el RGBA se remuestrea con alpha premultiplicado para que los
+    píxeles transparentes no tiñan los bordes.
+    """
+    src_h, src_w, _ = src.shape
+    h_bounds, h_weights = _cached_coefficients(src_w, dst_w)
+    v_bounds, v_weights = _cached_coefficients(src_h, dst_h)
+    return _resample(src, dst_h, dst_w, h_bounds, h_weights, v_bounds, v_weights)
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _resample(src, dst_h, dst_w, h_bounds, h_weights, v_bounds, v_weights):
+    """Aplica las dos pasadas (horizontal y vertical) con tablas de pesos ya calculadas"""
+    src_h, src_w, channels = src.shape
+    has_alpha = channels == 4
+
+    # Premultiplicar el alpha una sola vez por píxel de origen (no en cada muestra del filtro)
+    pre = src.astype(np.float32)
+    if has_alpha:
+        for y in numba.prange(src_h):
+            for x in range(src_w):
+                alpha = pre[y, x, 3]
+                for c in range(3):
+                    pre[y, x, c] = math.floor(pre[y, x, c] * alpha / np.float32(255.0) + 0.5)
+
+    # Pasada horizontal: cada fila es independiente
+    tmp = np.empty((src_h, dst_w, channels), np.float32)
+    for y in numba.prange(src_h):
+        for x in range(dst_w):
+            xmin = h_bounds[x, 0]
+            count = h_bounds[x, 1]
+            for c in range(channels):
+                acc = 0.0
+                for k in range(count):
+                    acc += pre[y, xmin + k, c] * h_weights[x, k]
+                # Como Pillow, el intermedio se redondea y recorta a 8 bits
+                tmp[y, x, c] = min(max(math.floor(acc + 0.5), 0.0), 255.0)
+
+    # Pasada vertical sobre el búfer intermedio (ya reducido en ancho)
+    out = np.empty((dst_h, dst_w, channels), np.uint8)
+    for y in numba.prange(dst_h):
+        ymin = v_bounds[y, 0]
+        count = v_bounds[y, 1]
+        for x in range(dst_w):
+            for c in range(channels):
+                acc = np.float32(0.0)
+                for k in range(count):
+                    acc += tmp[ymin + k, x, c] * v_weights[y, k]
+                out[y, x, c] = np.uint8(min(max(math.floor(acc + 0.5), 0.0), 255.0))
+
+            # Deshacer el premultiplicado
+            if has_alpha:
+                alpha = np.int64(out[y, x, 3])
+                for c in range(3):
+                    if alpha == 0:
+                        out[y, x, c] = 0
+                    else:
+                        out[y, x, c] = np.uint8(min(255 * np.int64(out[y, x, c]) // alpha, 255))
+    return out